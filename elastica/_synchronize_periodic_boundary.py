@@ -2,6 +2,7 @@ __doc__ = (
     """These functions are used to synchronize periodic boundaries for ring rods.  """
 )
 
+import numpy as np
 from numba import njit
 from elastica.boundary_conditions import ConstraintBase
 
@@ -78,19 +79,34 @@ class _ConstrainPeriodicBoundaries(ConstraintBase):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Indices are frozen here as read-only contiguous copies, so that the
+        # per-step calls do not depend on the system attributes
+        self.periodic_boundary_nodes_idx = _frozen_indices(
+            self.system.periodic_boundary_nodes_idx
+        )
+        self.periodic_boundary_elems_idx = _frozen_indices(
+            self.system.periodic_boundary_elems_idx
+        )
 
     def constrain_values(self, rod, time):
         _synchronize_periodic_boundary_of_vector_collection(
-            rod.position_collection, rod.periodic_boundary_nodes_idx
+            rod.position_collection, self.periodic_boundary_nodes_idx
         )
         _synchronize_periodic_boundary_of_matrix_collection(
-            rod.director_collection, rod.periodic_boundary_elems_idx
+            rod.director_collection, self.periodic_boundary_elems_idx
         )
 
     def constrain_rates(self, rod, time):
         _synchronize_periodic_boundary_of_vector_collection(
-            rod.velocity_collection, rod.periodic_boundary_nodes_idx
+            rod.velocity_collection, self.periodic_boundary_nodes_idx
         )
         _synchronize_periodic_boundary_of_vector_collection(
-            rod.omega_collection, rod.periodic_boundary_elems_idx
+            rod.omega_collection, self.periodic_boundary_elems_idx
         )
+
+
+def _frozen_indices(indices):
+    """Returns a read-only, contiguous np.intp copy of the indices"""
+    frozen = np.array(indices, dtype=np.intp, order="C")
+    frozen.flags.writeable = False
+    return frozen
@@ -21,15 +21,28 @@ class ConstraintBase(ABC):
     -----
     Constraint class must inherit BaseConstraint class.
 
+    Constraint class can optionally define the classmethods
+    `batch_constrain_values(cls, systems, constraints, time)` and
+    `batch_constrain_rates(cls, systems, constraints, time)`. Then, consecutive
+    constraints of that class are applied with a single call, where `systems` and
+    `constraints` are tuples of the same length.
+
 
         Attributes
         ----------
         system : RodBase or RigidBodyBase
         node_indices : None or numpy.ndarray
         element_indices : None or numpy.ndarray
+        requires_owned_storage : bool
+            If False, the positions and directors passed to __init__ are read-only
+            views of the system instead of copies. Only set it to False if __init__
+            copies what it needs to keep. The flag is only honoured on the class that
+            sets it, so subclasses receive copies unless they set it again.
 
     """
 
+    requires_owned_storage: bool = True
+
     _system: SystemType
     _constrained_position_idx: np.ndarray
     _constrained_director_idx: np.ndarray
@@ -141,8 +154,17 @@ class OneEndFixedBC(ConstraintBase):
     ...    constrained_position_idx=(0,),
     ...    constrained_director_idx=(0,)
     ... )
+
+    Notes
+    -----
+    The `fixed_position_collection` and `fixed_directors_collection` arrays are
+    captured when the simulator is finalized. Update them in-place afterwards;
+    rebinding the attributes to new arrays has no effect on the simulation.
     """
 
+    # fixed position and directors are copied in __init__
+    requires_owned_storage = False
+
     def __init__(self, fixed_position, fixed_directors, **kwargs):
         """
 
@@ -264,6 +286,9 @@ class GeneralConstraint(ConstraintBase):
     ... )
     """
 
+    # fixed positions and directors are copied in __init__
+    requires_owned_storage = False
+
     def __init__(
         self,
         *fixed_data,
@@ -489,6 +514,9 @@ class FixedConstraint(GeneralConstraint):
     GeneralConstraint: Generalized constraint with configurable DOF.
     """
 
+    # fixed positions and directors are copied in GeneralConstraint.__init__
+    requires_owned_storage = False
+
     def __init__(self, *args, **kwargs):
         """
 
@@ -144,11 +144,10 @@ class AnalyticalLinearDamper(DamperBase):
         )
 
     def dampen_rates(self, rod: RodType, time: float):
-        rod.velocity_collection[:] = (
-            rod.velocity_collection * self.translational_damping_coefficient
-        )
+        # Damp in-place, without allocating temporaries of the size of the rates
+        rod.velocity_collection *= self.translational_damping_coefficient
 
-        rod.omega_collection[:] = rod.omega_collection * np.power(
+        rod.omega_collection *= np.power(
             self.rotational_damping_coefficient, rod.dilatation
         )
 
@@ -129,6 +129,30 @@ class BaseSystemCollection(MutableSequence):
 
         return sys_idx
 
+    def _get_memory_order_of_systems(self):
+        """
+        Returns the rank of each system index following the memory layout of the memory
+        blocks, i.e. systems stored in the same block are ranked consecutively in the
+        order they are stored. Systems that are not stored in a memory block (memory
+        blocks themselves, surfaces, or before the blocks are constructed) are ranked
+        after, in the order of their index.
+
+        Returns
+        -------
+        dict
+            Map from (non-negative) system index to its rank.
+        """
+        memory_order = {}
+        for memory_block in getattr(self, "_memory_blocks", []):
+            for sys_idx in memory_block.system_idx_list:
+                memory_order.setdefault(int(sys_idx), len(memory_order))
+
+        n_systems_in_blocks = len(memory_order)
+        for sys_idx in range(len(self._systems)):
+            memory_order.setdefault(sys_idx, n_systems_in_blocks + sys_idx)
+
+        return memory_order
+
     def finalize(self):
         """
         This method finalizes the simulator class. When it is called, it is assumed that the user has appended
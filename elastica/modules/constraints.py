@@ -5,7 +5,13 @@ Constraints
 Provides the constraints interface to enforce displacement boundary conditions (see `boundary_conditions.py`).
 """
 
-from elastica.boundary_conditions import ConstraintBase
+from functools import partial
+from itertools import groupby
+
+import numpy as np
+from numba import njit
+
+from elastica.boundary_conditions import ConstraintBase, FreeBC, OneEndFixedBC
 
 
 class Constraints:
@@ -62,26 +68,171 @@ class Constraints:
             for constraint in self._constraints
         ]
 
-        # Sort from lowest id to highest id for potentially better memory access
+        # Sort following the memory layout of the systems for better memory access.
+        # Without memory blocks, this is from lowest id to highest id.
         # _constraints contains list of tuples. First element of tuple is rod number and
         # following elements are the type of boundary condition such as
         # [(0, ConstraintBase, OneEndFixedBC), (1, HelicalBucklingBC), ... ]
         # Thus using lambda we iterate over the list of tuples and use rod number (x[0])
-        # to sort constraints.
-        self._constraints.sort(key=lambda x: x[0])
+        # to sort constraints. Negative rod numbers are wrapped to look up their rank.
+        memory_order = self._get_memory_order_of_systems()
+        n_systems = len(self._systems)
+        self._constraints.sort(key=lambda x: memory_order[x[0] % n_systems])
+
+        # Cache one callable of time per constraint, bound to its target system, so
+        # that the per-step calls do not need to index systems or look up methods.
+        # Common boundary conditions are dispatched directly to a numba kernel.
+        # Consecutive constraints of the same class that define the optional
+        # batch_constrain_values/batch_constrain_rates classmethods are applied with
+        # a single call instead. Constraints that do nothing on values (or rates)
+        # get no operator there. _constraints is kept for introspection only.
+        constrain_values_operators = []
+        constrain_rates_operators = []
+        for bc_cls, group in groupby(self._constraints, key=lambda x: type(x[1])):
+            group = tuple(group)
+            systems = tuple(self._systems[sys_id] for sys_id, _ in group)
+            constraints = tuple(constraint for _, constraint in group)
+
+            if hasattr(bc_cls, "batch_constrain_values"):
+                constrain_values_operators.append(
+                    partial(bc_cls.batch_constrain_values, systems, constraints)
+                )
+            else:
+                constrain_values_operators.extend(
+                    _get_constrain_values_operator(constraint, system)
+                    for system, constraint in zip(systems, constraints)
+                    if type(constraint).constrain_values is not FreeBC.constrain_values
+                )
+
+            if hasattr(bc_cls, "batch_constrain_rates"):
+                constrain_rates_operators.append(
+                    partial(bc_cls.batch_constrain_rates, systems, constraints)
+                )
+            else:
+                constrain_rates_operators.extend(
+                    _get_constrain_rates_operator(constraint, system)
+                    for system, constraint in zip(systems, constraints)
+                    if type(constraint).constrain_rates is not FreeBC.constrain_rates
+                )
+
+        # dev : operators are kept in tuples rather than a (structured) NumPy array.
+        # Iterating NumPy records from Python creates a scalar object per access and
+        # is about an order of magnitude slower for this loop.
+        self._constrain_values_operators = tuple(constrain_values_operators)
+        self._constrain_rates_operators = tuple(constrain_rates_operators)
+
+        # Nothing to constrain at every step, remove the calls altogether
+        if not self._constrain_values_operators:
+            self._feature_group_constrain_values.remove(self._constrain_values)
+        if not self._constrain_rates_operators:
+            self._feature_group_constrain_rates.remove(self._constrain_rates)
 
         # At t=0.0, constrain all the boundary conditions (for compatability with
         # initial conditions)
         self._constrain_values(time=0.0)
         self._constrain_rates(time=0.0)
 
-    def _constrain_values(self, time, *args, **kwargs):
-        for sys_id, constraint in self._constraints:
-            constraint.constrain_values(self._systems[sys_id], time, *args, **kwargs)
+    def _constrain_values(self, time):
+        for constrain_values in self._constrain_values_operators:
+            constrain_values(time)
+
+    def _constrain_rates(self, time):
+        for constrain_rates in self._constrain_rates_operators:
+            constrain_rates(time)
+
+
+def _get_constrain_values_operator(constraint, system):
+    """
+    Returns a callable of time that constrains the values of the given system.
+
+    Parameters
+    ----------
+    constraint : ConstraintBase
+        Instantiated boundary condition.
+    system : SystemType
+        System the boundary condition is applied to.
+
+    Returns
+    -------
+    callable
+    """
+    # dev : kernels capture the array references, which is safe since the arrays
+    # of systems are only updated in-place after finalize. Subclasses that override
+    # either the method or its kernel fall back to the generic path.
+    constraint_cls = type(constraint)
+    if (
+        constraint_cls.constrain_values is OneEndFixedBC.constrain_values
+        and constraint_cls.compute_constrain_values
+        is OneEndFixedBC.compute_constrain_values
+    ):
+        return partial(
+            _constrain_values_one_end_fixed,
+            system.position_collection,
+            constraint.fixed_position_collection,
+            system.director_collection,
+            constraint.fixed_directors_collection,
+        )
+    return partial(constraint.constrain_values, system)
+
+
+def _get_constrain_rates_operator(constraint, system):
+    """
+    Returns a callable of time that constrains the rates of the given system.
+
+    Parameters
+    ----------
+    constraint : ConstraintBase
+        Instantiated boundary condition.
+    system : SystemType
+        System the boundary condition is applied to.
+
+    Returns
+    -------
+    callable
+    """
+    constraint_cls = type(constraint)
+    if (
+        constraint_cls.constrain_rates is OneEndFixedBC.constrain_rates
+        and constraint_cls.compute_constrain_rates
+        is OneEndFixedBC.compute_constrain_rates
+    ):
+        return partial(
+            _constrain_rates_one_end_fixed,
+            system.velocity_collection,
+            system.omega_collection,
+        )
+    return partial(constraint.constrain_rates, system)
+
 
-    def _constrain_rates(self, time, *args, **kwargs):
-        for sys_id, constraint in self._constraints:
-            constraint.constrain_rates(self._systems[sys_id], time, *args, **kwargs)
+_compute_constrain_values_one_end_fixed = OneEndFixedBC.compute_constrain_values
+_compute_constrain_rates_one_end_fixed = OneEndFixedBC.compute_constrain_rates
+
+
+@njit(cache=True)
+def _constrain_values_one_end_fixed(
+    position_collection,
+    fixed_position_collection,
+    director_collection,
+    fixed_directors_collection,
+    time,
+):
+    """
+    OneEndFixedBC.compute_constrain_values, taking the time argument of operators.
+    """
+    _compute_constrain_values_one_end_fixed(
+        position_collection,
+        fixed_position_collection,
+        director_collection,
+        fixed_directors_collection,
+    )
+
+
+@njit(cache=True)
+def _constrain_rates_one_end_fixed(velocity_collection, omega_collection, time):
+    """
+    OneEndFixedBC.compute_constrain_rates, taking the time argument of operators.
+    """
+    _compute_constrain_rates_one_end_fixed(velocity_collection, omega_collection)
 
 
 class _Constraint:
@@ -170,21 +321,47 @@ class _Constraint:
             "constrained_director_idx", None
         )  # calculate director indices as a tuple
 
+        # Indices can also be given as a slice or an array. Slices are resolved into
+        # a tuple of indices before being passed to the boundary condition.
+        for name, indices in (
+            ("constrained_position_idx", pos_indices),
+            ("constrained_director_idx", director_indices),
+        ):
+            if not (
+                indices is None or isinstance(indices, slice) or np.ndim(indices) == 1
+            ):
+                raise TypeError(
+                    "{0} should be a slice or a 1D sequence of indices, "
+                    "but {1} was given.".format(name, indices)
+                )
+        kwargs = dict(self._kwargs)
+        if isinstance(pos_indices, slice):
+            kwargs["constrained_position_idx"] = tuple(
+                range(*pos_indices.indices(rod.position_collection.shape[-1]))
+            )
+        if isinstance(director_indices, slice):
+            kwargs["constrained_director_idx"] = tuple(
+                range(*director_indices.indices(rod.director_collection.shape[-1]))
+            )
+
         # If pos_indices is not None, construct list else empty list
-        # IMPORTANT : do copy for memory-safe operations
+        # IMPORTANT : do copy for memory-safe operations, unless the boundary
+        # condition makes its own copy. The flag is not inherited, since a subclass
+        # may keep the arguments without copying them.
+        copy = vars(self._bc_cls).get("requires_owned_storage", True)
         positions = (
-            [rod.position_collection[..., idx].copy() for idx in pos_indices]
-            if pos_indices
+            _get_indexed_slices(rod.position_collection, pos_indices, copy)
+            if pos_indices is not None
             else []
         )
         directors = (
-            [rod.director_collection[..., idx].copy() for idx in director_indices]
-            if director_indices
+            _get_indexed_slices(rod.director_collection, director_indices, copy)
+            if director_indices is not None
             else []
         )
         try:
             bc = self._bc_cls(
-                *positions, *directors, *self._args, _system=rod, **self._kwargs
+                *positions, *directors, *self._args, _system=rod, **kwargs
             )
             return bc
         except (TypeError, IndexError):
@@ -196,3 +373,44 @@ class _Constraint:
                 "the __init__ method. eg MyBC.__init__(pos_one, director_one, director_two)\n"
                 "should have the `using` call as .using(MyBC, positions=(1,), directors=(1,-1))\n"
             )
+
+
+def _get_indexed_slices(collection, indices, copy=True):
+    """
+    Returns the requested slices along the last axis of the collection.
+
+    If copy is True, all slices are gathered with a single copy (basic slicing for a
+    slice, fancy-indexing otherwise) and returned as views into that copy. Otherwise,
+    they are returned as read-only views into the collection.
+
+    Parameters
+    ----------
+    collection : numpy.ndarray
+        (..., blocksize) array, such as position or director collection.
+    indices : tuple or slice or numpy.ndarray
+        Indices along the last axis.
+    copy : bool
+
+    Returns
+    -------
+    list
+        List of (...) arrays, one per requested index.
+    """
+    if isinstance(indices, slice):
+        block = collection[..., indices]
+        if copy:
+            block = block.copy()
+        else:
+            # block is a new view, this does not affect the collection
+            block.flags.writeable = False
+    elif copy:
+        # dev : fancy-indexing already returns a fresh copy, so the views below do
+        # not alias the system's memory.
+        block = collection[..., np.asarray(indices, dtype=np.intp)]
+    else:
+        slices = [collection[..., idx] for idx in indices]
+        for data in slices:
+            data.flags.writeable = False
+        return slices
+
+    return [block[..., k] for k in range(block.shape[-1])]
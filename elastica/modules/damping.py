@@ -69,9 +69,15 @@ class Damping:
         # to sort dampers.
         self._dampers.sort(key=lambda x: x[0])
 
+        # Cache the systems along with their dampers, so that the per-step calls do
+        # not need to index systems. _dampers is kept for introspection only.
+        self._dampers_operators = tuple(
+            (self._systems[sys_id], damper) for sys_id, damper in self._dampers
+        )
+
     def _dampen_rates(self, time, *args, **kwargs):
-        for sys_id, damper in self._dampers:
-            damper.dampen_rates(self._systems[sys_id], time, *args, **kwargs)
+        for system, damper in self._dampers_operators:
+            damper.dampen_rates(system, time, *args, **kwargs)
 
 
 class _Damper:
@@ -71,19 +71,13 @@ def allocate(
             )
 
     # Compute rest lengths and tangents
-    position_for_difference = (
-        np.hstack((position, position[..., 0].reshape(3, 1)))
-        if ring_rod_flag
-        else position
-    )
-    position_diff = position_for_difference[..., 1:] - position_for_difference[..., :-1]
+    position_diff = _compute_position_diff(position, n_elements, ring_rod_flag)
     rest_lengths = _batch_norm(position_diff)
-    tangents = position_diff / rest_lengths
+    # position_diff is a temporary, normalize it in place to get the tangents
+    tangents = np.divide(position_diff, rest_lengths, out=position_diff)
     normal /= np.linalg.norm(normal)
 
     if directors is None:  # Generate straight uniform rod
-        # Set the directors matrix
-        directors = np.zeros((MaxDimension.value(), MaxDimension.value(), n_elements))
         # Construct directors using tangents and normal
         normal_collection = np.repeat(normal[:, np.newaxis], n_elements, axis=1)
         # Check if rod normal and rod tangent are perpendicular to each other otherwise
@@ -94,9 +88,10 @@ def allocate(
             atol=Tolerance.atol(),
             err_msg=(" Rod normal and tangent are not perpendicular to each other!"),
         )
-        directors[0, ...] = normal_collection
-        directors[1, ...] = _batch_cross(tangents, normal_collection)
-        directors[2, ...] = tangents
+        # Set the directors matrix, stacking (d1, d2, d3) along the first axis
+        directors = np.stack(
+            (normal_collection, _batch_cross(tangents, normal_collection), tangents)
+        )
     _directors_validity_checker(directors, tangents, n_elements)
 
     # Set radius array
@@ -335,6 +330,21 @@ Returns
 """
 
 
+def _compute_position_diff(position, n_elements, ring_rod_flag):
+    """Differences between consecutive nodes, one per element"""
+    n_nodes = n_elements if ring_rod_flag else n_elements + 1
+    _assert_shape(position, (MaxDimension.value(), n_nodes), "position")
+
+    position_diff = np.empty((MaxDimension.value(), n_elements))
+    np.subtract(
+        position[..., 1:], position[..., :-1], out=position_diff[..., : n_nodes - 1]
+    )
+    if ring_rod_flag:
+        # Last element of the ring rod closes the loop, from the last to the first node
+        np.subtract(position[..., 0], position[..., -1], out=position_diff[..., -1])
+    return position_diff
+
+
 def _assert_dim(vector, max_dim: int, name: str):
     assert vector.ndim < max_dim, (
         f"Input {name} dimension is not correct {vector.shape}"
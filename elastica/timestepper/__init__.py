@@ -1,7 +1,6 @@
 __doc__ = """Timestepping utilities to be used with Rod and RigidBody classes"""
 
 
-import numpy as np
 from tqdm import tqdm
 from elastica.timestepper.symplectic_steppers import (
     SymplecticStepperTag,
@@ -99,7 +98,9 @@ def integrate(
     # state
     do_step, stages_and_updates = extend_stepper_interface(StatefulStepper, System)
 
-    dt = np.float64(float(final_time) / n_steps)
+    # dev : keep dt (and therefore time) as a Python float. A NumPy scalar would box a
+    # new np.float64 at every time update, which is several times slower.
+    dt = float(final_time) / n_steps
     time = restart_time
 
     for i in tqdm(range(n_steps), disable=(not progress_bar)):
@@ -96,36 +96,46 @@ class AxialStretchingCallBack(ea.CallBackBaseClass):
     Tracks the velocity norms of the rod
     """
 
-    def __init__(self, step_skip: int, callback_params: dict):
+    def __init__(self, step_skip: int, num_frames: int, callback_params: dict):
         ea.CallBackBaseClass.__init__(self)
         self.every = step_skip
         self.callback_params = callback_params
+        # Preallocate the history, instead of appending a new entry every frame
+        self.callback_params["time"] = np.empty(num_frames)
+        self.callback_params["position"] = np.empty(num_frames)
+        self.callback_params["velocity_norms"] = np.empty(num_frames)
 
     def make_callback(self, system, time, current_step: int):
 
         if current_step % self.every == 0:
 
-            self.callback_params["time"].append(time)
+            frame = current_step // self.every
+            self.callback_params["time"][frame] = time
             # Collect only x
-            self.callback_params["position"].append(
-                system.position_collection[0, -1].copy()
-            )
-            self.callback_params["velocity_norms"].append(
-                np.linalg.norm(system.velocity_collection.copy())
+            self.callback_params["position"][frame] = system.position_collection[0, -1]
+            # Frobenius norm as a single contraction, without flattening the
+            # (possibly non-contiguous) velocity view
+            velocity = system.velocity_collection
+            self.callback_params["velocity_norms"][frame] = np.sqrt(
+                np.einsum("ij,ij->", velocity, velocity)
             )
             return
 
 
-recorded_history = ea.defaultdict(list)
+total_steps = int(final_time / dt)
+step_skip = 200
+recorded_history = {}
 stretch_sim.collect_diagnostics(stretchable_rod).using(
-    AxialStretchingCallBack, step_skip=200, callback_params=recorded_history
+    AxialStretchingCallBack,
+    step_skip=step_skip,
+    num_frames=total_steps // step_skip + 1,
+    callback_params=recorded_history,
 )
 
 stretch_sim.finalize()
 timestepper = ea.PositionVerlet()
 # timestepper = PEFRL()
 
-total_steps = int(final_time / dt)
 print("Total steps", total_steps)
 ea.integrate(timestepper, stretch_sim, final_time, total_steps)
 
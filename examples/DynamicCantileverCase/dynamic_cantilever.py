@@ -5,6 +5,10 @@ import elastica as ea
 from analytical_dynamic_cantilever import AnalyticalDynamicCantilever
 
 
+class DynamicCantileverSimulator(ea.BaseSystemCollection, ea.Constraints, ea.CallBacks):
+    pass
+
+
 def simulate_dynamic_cantilever_with(
     density=2000.0,
     n_elem=100,
@@ -36,12 +40,6 @@ def simulate_dynamic_cantilever_with(
         A collection of parameters for post-processing.
 
     """
-
-    class DynamicCantileverSimulator(
-        ea.BaseSystemCollection, ea.Constraints, ea.CallBacks
-    ):
-        pass
-
     cantilever_sim = DynamicCantileverSimulator()
 
     # Add test parameters
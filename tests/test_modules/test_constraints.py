@@ -4,7 +4,11 @@ from numpy.testing import assert_allclose
 import pytest
 
 from elastica.modules import Constraints
-from elastica.modules.constraints import _Constraint
+from elastica.modules.constraints import (
+    _Constraint,
+    _constrain_values_one_end_fixed,
+    _constrain_rates_one_end_fixed,
+)
 
 
 class TestConstraint:
@@ -103,6 +107,146 @@ class TestConstraint:
             )
         assert mock_bc.k == 1
 
+    @pytest.mark.parametrize("position_indices", [(0,), (1, 2), (-1, 0)])
+    def test_call_with_positions_kwargs_does_not_alias_rod(
+        self, load_constraint, position_indices
+    ):
+        def mock_init(self, *args, **kwargs):
+            self.start_pos = args
+
+        # in place class
+        MockBC = type("MockBC", (self.TestBC, object), {"__init__": mock_init})
+
+        constraint = load_constraint
+        constraint.using(MockBC, constrained_position_idx=position_indices)
+
+        mock_rod = self.MockRod()
+        reference = mock_rod.position_collection.copy()
+        mock_bc = constraint(mock_rod)
+
+        # Modifying stored positions should not modify the rod
+        for stored_position in mock_bc.start_pos:
+            assert not np.shares_memory(stored_position, mock_rod.position_collection)
+            stored_position[...] = 0.0
+        assert_allclose(mock_rod.position_collection, reference)
+
+    @pytest.mark.parametrize("position_indices", [(0,), (1, 2)])
+    def test_call_without_owned_storage_passes_read_only_views(
+        self, load_constraint, position_indices
+    ):
+        def mock_init(self, *args, **kwargs):
+            self.start_pos = args
+
+        # in place class
+        MockBC = type(
+            "MockBC",
+            (self.TestBC, object),
+            {"__init__": mock_init, "requires_owned_storage": False},
+        )
+
+        constraint = load_constraint
+        constraint.using(MockBC, constrained_position_idx=position_indices)
+
+        mock_rod = self.MockRod()
+        mock_bc = constraint(mock_rod)
+
+        for pos_idx_in_rod, stored_position in zip(position_indices, mock_bc.start_pos):
+            assert np.shares_memory(stored_position, mock_rod.position_collection)
+            assert not stored_position.flags.writeable
+            assert_allclose(
+                stored_position, mock_rod.position_collection[..., pos_idx_in_rod]
+            )
+        # The rod itself stays writeable
+        assert mock_rod.position_collection.flags.writeable
+
+    def test_call_with_subclass_of_no_owned_storage_bc_passes_copies(
+        self, load_constraint
+    ):
+        def mock_init(self, *args, **kwargs):
+            self.start_pos = args
+
+        # in place classes, the subclass does not set the flag itself
+        MockBC = type(
+            "MockBC",
+            (self.TestBC, object),
+            {"__init__": mock_init, "requires_owned_storage": False},
+        )
+        MockSubBC = type("MockSubBC", (MockBC,), {})
+
+        constraint = load_constraint
+        constraint.using(MockSubBC, constrained_position_idx=(0, 1))
+
+        mock_rod = self.MockRod()
+        mock_bc = constraint(mock_rod)
+
+        for stored_position in mock_bc.start_pos:
+            assert not np.shares_memory(stored_position, mock_rod.position_collection)
+            assert stored_position.flags.writeable
+
+    @pytest.mark.parametrize(
+        "position_indices, expected_indices",
+        [
+            (slice(1, 3), (1, 2)),
+            (slice(-2, None), (6, 7)),
+            (np.array([0, 3, 6]), (0, 3, 6)),
+            (np.array([], dtype=int), ()),
+        ],
+    )
+    @pytest.mark.parametrize("requires_owned_storage", [True, False])
+    def test_call_with_slice_or_array_positions_kwargs(
+        self,
+        load_constraint,
+        position_indices,
+        expected_indices,
+        requires_owned_storage,
+    ):
+        def mock_init(self, *args, **kwargs):
+            self.start_pos = args
+            self.position_idx = kwargs["constrained_position_idx"]
+
+        # in place class
+        MockBC = type(
+            "MockBC",
+            (self.TestBC, object),
+            {
+                "__init__": mock_init,
+                "requires_owned_storage": requires_owned_storage,
+            },
+        )
+
+        constraint = load_constraint
+        constraint.using(MockBC, constrained_position_idx=position_indices)
+
+        mock_rod = self.MockRod()
+        mock_bc = constraint(mock_rod)
+
+        assert len(mock_bc.start_pos) == len(expected_indices)
+        for pos_idx_in_rod, stored_position in zip(expected_indices, mock_bc.start_pos):
+            assert_allclose(
+                stored_position, mock_rod.position_collection[..., pos_idx_in_rod]
+            )
+            assert (
+                np.shares_memory(stored_position, mock_rod.position_collection)
+                is not requires_owned_storage
+            )
+        if isinstance(position_indices, slice):
+            assert mock_bc.position_idx == expected_indices
+
+    @pytest.mark.parametrize("indices", [0, np.array(1), ((0, 1), (2, 3))])
+    @pytest.mark.parametrize(
+        "indices_kwarg", ["constrained_position_idx", "constrained_director_idx"]
+    )
+    def test_call_with_non_1d_indices_throws_type_error(
+        self, load_constraint, indices, indices_kwarg
+    ):
+        constraint = load_constraint
+        constraint.using(self.TestBC, **{indices_kwarg: indices})
+
+        mock_rod = self.MockRod()
+        with pytest.raises(TypeError) as excinfo:
+            constraint(mock_rod)
+        assert "1D sequence of indices" in str(excinfo.value)
+
     @pytest.mark.parametrize("director_indices", [(4,), (0, 3), (0, 1, 5)])
     def test_call_with_directors_kwargs(self, load_constraint, director_indices):
         def mock_init(self, *args, **kwargs):
@@ -338,6 +482,190 @@ class TestConstraintsMixin:
             # Test element indices. TODO: maybe add more generalized test
             assert y.constrained_director_idx.size == 0
 
+    def test_constrain_finalize_caches_operators(self, load_rod_with_constraints):
+        scwc, _ = load_rod_with_constraints
+        scwc._finalize_constraints()
+
+        assert len(scwc._constrain_values_operators) == len(scwc._constraints)
+        assert len(scwc._constrain_rates_operators) == len(scwc._constraints)
+        for i, (sys_id, constraint) in enumerate(scwc._constraints):
+            values_op = scwc._constrain_values_operators[i]
+            rates_op = scwc._constrain_rates_operators[i]
+            assert values_op.func == constraint.constrain_values
+            assert values_op.args[0] is scwc._systems[sys_id]
+            assert rates_op.func == constraint.constrain_rates
+            assert rates_op.args[0] is scwc._systems[sys_id]
+
+    def test_constrain_finalize_groups_batched_constraints(
+        self, load_system_with_constraints
+    ):
+        scwc = load_system_with_constraints
+        calls = []
+
+        class MockBatchBC(self.ConstraintBase):
+            def constrain_values(self, *args, **kwargs) -> None:
+                raise NotImplementedError
+
+            def constrain_rates(self, *args, **kwargs) -> None:
+                pass
+
+            @classmethod
+            def batch_constrain_values(cls, systems, constraints, time) -> None:
+                calls.append((systems, constraints, time))
+
+        scwc.constrain(1).using(MockBatchBC)
+        scwc.constrain(0).using(MockBatchBC)
+        scwc._finalize_constraints()
+        calls.clear()
+
+        # One batched operator for values, one operator per constraint for rates
+        assert len(scwc._constrain_values_operators) == 1
+        assert len(scwc._constrain_rates_operators) == 2
+
+        scwc._constrain_values(time=1.0)
+        assert len(calls) == 1
+        systems, constraints, time = calls[0]
+        assert systems == (scwc._systems[0], scwc._systems[1])
+        assert constraints == (scwc._constraints[0][1], scwc._constraints[1][1])
+        assert time == 1.0
+
+    def test_constrain_finalize_skips_free_constraints(
+        self, load_system_with_constraints
+    ):
+        from elastica.boundary_conditions import FreeBC
+
+        scwc = load_system_with_constraints
+
+        class MockValuesBC(FreeBC):
+            def constrain_values(self, *args, **kwargs) -> None:
+                pass
+
+        scwc.constrain(0).using(FreeBC)
+        scwc.constrain(1).using(MockValuesBC)
+        scwc._finalize_constraints()
+
+        assert len(scwc._constraints) == 2
+        assert len(scwc._constrain_values_operators) == 1
+        assert len(scwc._constrain_rates_operators) == 0
+        assert (
+            scwc._constrain_values_operators[0].func
+            == scwc._constraints[1][1].constrain_values
+        )
+
+    def test_constrain_finalize_removes_empty_feature_calls(
+        self, load_system_with_constraints
+    ):
+        from elastica.boundary_conditions import FreeBC
+
+        scwc = load_system_with_constraints
+
+        class MockValuesBC(FreeBC):
+            def constrain_values(self, *args, **kwargs) -> None:
+                pass
+
+        scwc.constrain(0).using(MockValuesBC)
+        assert scwc._constrain_values in scwc._feature_group_constrain_values
+        assert scwc._constrain_rates in scwc._feature_group_constrain_rates
+        scwc._finalize_constraints()
+
+        assert scwc._constrain_values in scwc._feature_group_constrain_values
+        assert scwc._constrain_rates not in scwc._feature_group_constrain_rates
+
+    def test_constrain_finalize_without_constraints(self, load_system_with_constraints):
+        scwc = load_system_with_constraints
+        scwc._finalize_constraints()
+
+        assert scwc._constrain_values not in scwc._feature_group_constrain_values
+        assert scwc._constrain_rates not in scwc._feature_group_constrain_rates
+        # Still callable, as a no-op
+        scwc.constrain_values(time=0.0)
+        scwc.constrain_rates(time=0.0)
+
+    @pytest.fixture
+    def load_straight_rod(self):
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        return CosseratRod.straight_rod(
+            4,
+            np.zeros(3),
+            np.array([1.0, 0.0, 0.0]),
+            np.array([0.0, 1.0, 0.0]),
+            1.0,
+            0.1,
+            1000.0,
+            youngs_modulus=1e6,
+        )
+
+    def test_constrain_one_end_fixed_uses_kernel(self, load_straight_rod):
+        from elastica.boundary_conditions import OneEndFixedBC
+
+        scwc = self.SystemCollectionWithConstraintsMixedin()
+        rod = load_straight_rod
+        scwc.append(rod)
+        scwc.constrain(rod).using(
+            OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+        )
+        scwc._finalize_constraints()
+        assert (
+            scwc._constrain_values_operators[0].func is _constrain_values_one_end_fixed
+        )
+        assert scwc._constrain_rates_operators[0].func is _constrain_rates_one_end_fixed
+
+        reference_position = rod.position_collection[..., 0].copy()
+        reference_director = rod.director_collection[..., 0].copy()
+        rod.position_collection[...] += 1.0
+        rod.director_collection[...] += 1.0
+        moved_position = rod.position_collection.copy()
+        rod.velocity_collection[...] = 1.0
+        rod.omega_collection[...] = 1.0
+
+        scwc._constrain_values(time=1.0)
+        scwc._constrain_rates(time=1.0)
+
+        assert_allclose(rod.position_collection[..., 0], reference_position)
+        assert_allclose(rod.director_collection[..., 0], reference_director)
+        assert_allclose(rod.position_collection[..., 1:], moved_position[..., 1:])
+        assert_allclose(rod.velocity_collection[..., 0], 0.0)
+        assert_allclose(rod.omega_collection[..., 0], 0.0)
+        assert_allclose(rod.velocity_collection[..., 1:], 1.0)
+        assert_allclose(rod.omega_collection[..., 1:], 1.0)
+
+    def test_constrain_one_end_fixed_overridden_kernel_is_used(self, load_straight_rod):
+        from numba import njit
+        from elastica.boundary_conditions import OneEndFixedBC
+
+        class PositionOnlyFixedBC(OneEndFixedBC):
+            @staticmethod
+            @njit
+            def compute_constrain_values(
+                position_collection,
+                fixed_position_collection,
+                director_collection,
+                fixed_directors_collection,
+            ):
+                position_collection[..., 0] = fixed_position_collection
+
+        scwc = self.SystemCollectionWithConstraintsMixedin()
+        rod = load_straight_rod
+        scwc.append(rod)
+        scwc.constrain(rod).using(
+            PositionOnlyFixedBC,
+            constrained_position_idx=(0,),
+            constrained_director_idx=(0,),
+        )
+        scwc._finalize_constraints()
+        assert (
+            scwc._constrain_values_operators[0].func
+            is not _constrain_values_one_end_fixed
+        )
+        assert scwc._constrain_rates_operators[0].func is _constrain_rates_one_end_fixed
+
+        rod.director_collection[...] = 5.0
+        scwc._constrain_values(time=1.0)
+
+        assert_allclose(rod.position_collection[..., 0], 0.0)
+        assert_allclose(rod.director_collection, 5.0)
+
     @pytest.mark.xfail
     def test_constrain_finalize_sorted(self, load_rod_with_constraints):
         scwc, bc_cls = load_rod_with_constraints
@@ -350,6 +678,40 @@ class TestConstraintsMixin:
             assert num < x
             num = x
 
+    def test_constrain_finalize_follows_memory_layout(self):
+        from elastica.boundary_conditions import FreeBC
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        scwc = self.SystemCollectionWithConstraintsMixedin()
+        straight_rod_kwargs = dict(
+            start=np.zeros(3),
+            direction=np.array([1.0, 0.0, 0.0]),
+            normal=np.array([0.0, 1.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.1,
+            density=1000.0,
+            youngs_modulus=1e6,
+        )
+        ring_rod_kwargs = dict(
+            ring_center_position=np.zeros(3),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([0.0, 1.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.1,
+            density=1000.0,
+            youngs_modulus=1e6,
+        )
+        # Ring rods are stored after straight rods in the memory block
+        scwc.append(CosseratRod.ring_rod(10, **ring_rod_kwargs))
+        scwc.append(CosseratRod.straight_rod(4, **straight_rod_kwargs))
+        scwc.append(CosseratRod.straight_rod(4, **straight_rod_kwargs))
+        for sys_idx in [0, 2, 1]:
+            scwc.constrain(sys_idx).using(FreeBC)
+        scwc.finalize()
+
+        # Periodic boundaries of the memory block are constrained last
+        assert [sys_idx for sys_idx, _ in scwc._constraints] == [1, 2, 0, 3]
+
     def test_constrain_call_on_systems(self):
         # TODO Finish after the architecture is complete
         pass
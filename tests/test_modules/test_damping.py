@@ -201,6 +201,17 @@ class TestDampingMixin:
             assert type(y.system) is type(mock_rod)
             assert y.system is mock_rod, f"{len(scwd._systems)}"
 
+    def test_dampers_finalize_caches_systems(self, load_rod_with_dampers):
+        scwd, _ = load_rod_with_dampers
+        scwd._finalize_dampers()
+
+        assert len(scwd._dampers_operators) == len(scwd._dampers)
+        for (sys_id, damper), (system, cached_damper) in zip(
+            scwd._dampers, scwd._dampers_operators
+        ):
+            assert system is scwd._systems[sys_id]
+            assert cached_damper is damper
+
     @pytest.mark.xfail
     def test_dampers_finalize_sorted(self, load_rod_with_dampers):
         scwd, damper_cls = load_rod_with_dampers
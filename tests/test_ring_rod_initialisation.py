@@ -294,6 +294,39 @@ def test_input_and_position_array_for_different_center_offset(n_elems):
     assert_allclose(correct_position, test_position, atol=Tolerance.atol())
 
 
+@pytest.mark.xfail(raises=AssertionError)
+@pytest.mark.parametrize("n_elems", [5, 10, 50])
+def test_input_position_array_invalid_shape(n_elems):
+    """
+    This test is checking if user gives position array with
+    one node too many and program throws an assertion error.
+    Parameters
+    ----------
+    n_elems
+
+    Returns
+    -------
+
+    """
+    direction = np.array([1.0, 0.0, 0.0])
+    normal = np.array([0.0, 0.0, 1.0])
+    base_length = 1.0
+    base_radius = 0.25
+    density = 1000
+    youngs_modulus = 1e6
+    MockRingRodForTest.ring_rod(
+        n_elems,
+        np.zeros(3),
+        direction,
+        normal,
+        base_length,
+        base_radius,
+        density,
+        youngs_modulus=youngs_modulus,
+        position=np.zeros((3, n_elems + 1)),
+    )
+
+
 def test_compute_position_array_using_user_inputs():
     """
     This test checks if the allocate function can compute correctly
@@ -182,3 +182,34 @@ def test_ConstrainPeriodicBoundaries():
     assert_allclose(
         test_omega_collection, test_rod.omega_collection, atol=Tolerance.atol()
     )
+
+
+def test_ConstrainPeriodicBoundaries_stores_system_indices():
+    test_rod = MockTestRingRod()
+    periodic_boundary_nodes_idx = test_rod.periodic_boundary_nodes_idx
+    periodic_boundary_elems_idx = test_rod.periodic_boundary_elems_idx
+    fixed_rod = _ConstrainPeriodicBoundaries(_system=test_rod)
+
+    for stored_idx, system_idx in [
+        (fixed_rod.periodic_boundary_nodes_idx, periodic_boundary_nodes_idx),
+        (fixed_rod.periodic_boundary_elems_idx, periodic_boundary_elems_idx),
+    ]:
+        assert stored_idx.dtype == np.intp
+        assert stored_idx.flags.c_contiguous
+        assert not stored_idx.flags.writeable
+        assert not np.shares_memory(stored_idx, system_idx)
+        assert_allclose(stored_idx, system_idx)
+
+    # Indices stored in the constraint are used, not looked up on the system
+    test_rod.periodic_boundary_nodes_idx = None
+    test_rod.periodic_boundary_elems_idx = None
+    correct_position_collection = test_rod.position_collection.copy()
+    correct_position_collection[
+        ..., periodic_boundary_nodes_idx[0]
+    ] = correct_position_collection[..., periodic_boundary_nodes_idx[1]]
+    fixed_rod.constrain_values(test_rod, time=0)
+    assert_allclose(
+        correct_position_collection,
+        test_rod.position_collection,
+        atol=Tolerance.atol(),
+    )